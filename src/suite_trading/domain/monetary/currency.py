@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from decimal import Decimal
 from enum import Enum
 from typing import Dict
 
@@ -55,6 +56,8 @@ class Currency:
         self._precision = precision
         self._name = name.strip()
         self._currency_type = currency_type
+        # Template for rounding amounts to this currency's precision (e.g. Decimal("0.01") for 2)
+        self._quant_template = Decimal(1).scaleb(-precision)
 
     @property
     def code(self) -> str:
@@ -66,6 +69,15 @@ class Currency:
         """Get the currency precision."""
         return self._precision
 
+    @property
+    def quant_template(self) -> Decimal:
+        """Get the Decimal template for rounding amounts to currency precision.
+
+        Pass it to `Decimal.quantize`, e.g. `value.quantize(USD.quant_template)` rounds to
+        2 decimal places.
+        """
+        return self._quant_template
+
     @property
     def name(self) -> str:
         """Get the currency name."""
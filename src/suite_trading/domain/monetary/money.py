@@ -1,11 +1,86 @@
 from __future__ import annotations
 
+import itertools
+import operator
 from decimal import Decimal, getcontext, InvalidOperation
+from typing import TYPE_CHECKING
 
 from suite_trading.domain.monetary.currency import Currency
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Set high precision for financial calculations
-getcontext().prec = 28
+_CONTEXT_PRECISION = 28
+getcontext().prec = _CONTEXT_PRECISION
+
+# Shared Decimal zero for zero checks on hot paths
+_ZERO = Decimal(0)
+
+# Largest int64 value; NumPy int64 sums beyond it wrap around silently
+_INT64_MAX = 2**63 - 1
+
+# Shared Money instances for small integer amounts, keyed by (amount, id(currency))
+_INTERN: dict[tuple[int, int], Money] = {}
+_INTERN_MIN = -10
+_INTERN_MAX = 10
+
+
+def _to_decimal(value: object) -> Decimal | None:
+    """Convert a numeric value to Decimal, or return None if Money does not support it.
+
+    Used for constructor values and arithmetic operands alike. Decimal and int values are
+    converted directly. Floats go through `str` so that e.g. 0.1 becomes Decimal("0.1") and
+    not its binary approximation. Numeric strings are parsed. Other integral types (e.g.
+    NumPy ints) are converted via `operator.index`. bool, non-finite values (NaN, infinity)
+    and all other types are not supported. Unsupported values return None instead
+    of raising, so arithmetic operators can return NotImplemented cheaply.
+
+    Args:
+        value: Numeric value (int, float, str, Decimal, or other integral type).
+
+    Returns:
+        Decimal | None: Converted value, or None if $value is not a supported number.
+    """
+    if isinstance(value, Decimal):
+        number = value
+    elif isinstance(value, bool):
+        # bool is an int subclass, but True/False are not amounts
+        return None
+    elif isinstance(value, int):
+        return Decimal(value)
+    elif isinstance(value, float):
+        number = Decimal(str(value))
+    elif isinstance(value, str):
+        try:
+            number = Decimal(value)
+        except InvalidOperation:
+            return None
+    else:
+        # Other integral types (e.g. NumPy ints) convert exactly through `__index__`
+        try:
+            return Decimal(operator.index(value))  # type: ignore[arg-type]
+        except TypeError:
+            return None
+    return number if number.is_finite() else None
+
+
+def _may_overflow_int64(minor_units: np.ndarray) -> bool:
+    """Return True if a NumPy sum or cumulative sum of $minor_units could wrap around.
+
+    No running total can exceed the largest absolute amount times the number of amounts, so
+    the check is two native passes (`min`, `max`) instead of an exact sum.
+
+    Args:
+        minor_units (np.ndarray): Integer array of amounts in minor units.
+
+    Returns:
+        bool: True if the totals may not fit into int64.
+    """
+    if minor_units.size == 0:
+        return False
+    largest_amount = max(abs(int(minor_units.max())), abs(int(minor_units.min())))
+    return largest_amount * minor_units.size > _INT64_MAX
 
 
 class Money:
@@ -16,11 +91,25 @@ class Money:
     +999,999,999,999.999999999999999999
     """
 
+    __slots__ = ("_value", "_currency", "_code", "_hash")
+
+    _value: Decimal
+    _currency: Currency
+    _code: str
+    _hash: int
+
     # Value limits
     MAX_VALUE = Decimal("999999999999.999999999999999999")
     MIN_VALUE = Decimal("-999999999999.999999999999999999")
+    # Whole-number bounds for the cheap int range check in `__init__`
+    _MAX_INT = int(MAX_VALUE)
+    _MIN_INT = int(MIN_VALUE)
+
+    # Highest currency precision at which a sum or difference of two in-range values (at most
+    # 13 integer digits) always fits into the Decimal context precision and so is never rounded
+    _MAX_EXACT_SUM_PRECISION = _CONTEXT_PRECISION - len(str(2 * _MAX_INT))
 
-    def __init__(self, value, currency: Currency):
+    def __init__(self, value: Decimal | int | float | str, currency: Currency) -> None:
         """Initialize Money with value and currency.
 
         Args:
@@ -35,25 +124,10 @@ class Money:
         if not isinstance(currency, Currency):
             raise TypeError(f"$currency must be a Currency instance, but provided value is: {currency}")
 
-        # Check: value must be convertible to Decimal
-        try:
-            if isinstance(value, Decimal):
-                decimal_value = value
-            else:
-                decimal_value = Decimal(str(value))
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"$value cannot be converted to Decimal, but provided value is: {value}") from e
-
-        # Check: value must be within allowed range
-        if decimal_value > self.MAX_VALUE:
-            raise ValueError(f"$value exceeds maximum allowed value {self.MAX_VALUE}, but provided value is: {decimal_value}")
-        if decimal_value < self.MIN_VALUE:
-            raise ValueError(f"$value is below minimum allowed value {self.MIN_VALUE}, but provided value is: {decimal_value}")
-
-        # Round to currency precision
-        precision_str = f"0.{'0' * currency.precision}" if currency.precision > 0 else "1"
-        self._value = decimal_value.quantize(Decimal(precision_str))
+        self._value = self._validate_value(value, currency)
         self._currency = currency
+        self._code = currency.code  # Cached for `__str__` and `__repr__`
+        self._hash = -1  # Computed lazily in `__hash__`
 
     @property
     def value(self) -> Decimal:
@@ -65,6 +139,89 @@ class Money:
         """Get the currency."""
         return self._currency
 
+    def to_minor_units(self) -> int:
+        """Return the amount as an integer number of minor units (inverse of `from_minor_units`).
+
+        Returns:
+            int: Amount in minor units, e.g. 12345 for 123.45 USD.
+        """
+        # Value is quantized to currency precision, so the scaled value is an exact integer
+        return int(self._value.scaleb(self._currency.precision))
+
+    @classmethod
+    def _validate_value(cls, value: object, currency: Currency, is_exact_sum: bool = False) -> Decimal:
+        """Convert $value to Decimal, check the allowed range, and round it to $currency precision.
+
+        Shared by the constructor and the arithmetic operators, so every Money is built by
+        the same rules.
+
+        Args:
+            value: Numeric value (int, float, str, Decimal).
+            currency (Currency): Currency whose precision the value is rounded to.
+            is_exact_sum (bool): True if $value is a sum or difference of a Money value and
+                another Money value or an int, so it is already at currency precision unless the
+                Decimal context rounded it.
+
+        Returns:
+            Decimal: Value rounded to currency precision.
+
+        Raises:
+            ValueError: If value is invalid, out of range, or cannot be represented at
+                currency precision within Decimal context precision.
+        """
+        max_value = cls.MAX_VALUE
+        min_value = cls.MIN_VALUE
+
+        # Check: int value must be within allowed range (cheap native compare before Decimal conversion)
+        if type(value) is int and not (cls._MIN_INT <= value <= cls._MAX_INT):
+            raise ValueError(f"$value is outside allowed range [{min_value}, {max_value}], but provided value is: {value}")
+
+        # Check: value must be convertible to Decimal
+        decimal_value = _to_decimal(value)
+        if decimal_value is None:
+            raise ValueError(f"$value cannot be converted to Decimal, but provided value is: {value}")
+
+        # Check: value must be within allowed range
+        if not (min_value <= decimal_value <= max_value):
+            raise ValueError(f"$value is outside allowed range [{min_value}, {max_value}], but provided value is: {decimal_value}")
+
+        # An int is already at the scale of a precision-0 currency
+        if type(value) is int and currency.precision == 0:
+            return decimal_value
+
+        # An exact sum is already at currency precision when the context cannot have rounded it
+        if is_exact_sum and currency.precision <= cls._MAX_EXACT_SUM_PRECISION:
+            return decimal_value
+
+        # Round to currency precision; `quantize` fails if the result needs more digits than the
+        # Decimal context precision, which also catches values the context already rounded
+        try:
+            return decimal_value.quantize(currency.quant_template)
+        except InvalidOperation as e:
+            raise ValueError(f"$value cannot be represented with {currency.precision} decimal places of Currency '{currency.code}' within Decimal context precision {getcontext().prec}, but provided value is: {decimal_value}") from e
+
+    @classmethod
+    def _new(cls, value: Decimal, currency: Currency) -> Money:
+        """Create Money from an already validated and quantized Decimal, skipping all checks.
+
+        Internal fast-path for results that are valid by construction (e.g. negation of a valid
+        Money) or were checked with `_validate_value`. Callers are responsible for $value being
+        a Decimal quantized to $currency precision and within the allowed range.
+
+        Args:
+            value (Decimal): Validated value, already rounded to currency precision.
+            currency (Currency): Currency object.
+
+        Returns:
+            Money: New Money object.
+        """
+        money = object.__new__(cls)
+        money._value = value
+        money._currency = currency
+        money._code = currency.code
+        money._hash = -1
+        return money
+
     def _check_same_currency(self, other: Money) -> None:
         """Check if two Money objects have the same currency.
 
@@ -74,139 +231,180 @@ class Money:
         Raises:
             ValueError: If currencies don't match.
         """
-        if self.currency != other.currency:
-            raise ValueError(f"Cannot operate on different currencies: {self.currency} and {other.currency}")
+        # Identity check first: operands almost always share the same Currency instance
+        if self._currency is not other._currency and self._currency != other._currency:
+            raise ValueError(f"Cannot operate on different currencies: {self._currency} and {other._currency}")
+
+    def _get_comparable_value(self, other: object) -> Decimal | None:
+        """Return the value of $other for ordering comparisons with this Money.
+
+        Args:
+            other: Object to compare with.
+
+        Returns:
+            Decimal | None: Value of $other, or None if $other is not Money.
+
+        Raises:
+            ValueError: If currencies don't match.
+        """
+        if other.__class__ is not Money:
+            return None
+        if self._currency is not other._currency:
+            self._check_same_currency(other)
+        return other._value
 
     # Comparison operators (same currency required)
-    def __eq__(self, other) -> bool:
+    def __eq__(self, other: object) -> bool:
         """Check equality with another Money object."""
-        if not isinstance(other, Money):
+        if self is other:
+            return True
+        if other.__class__ is not Money:
             return False
-        if self.currency != other.currency:
+        if self._currency is not other._currency and self._currency != other._currency:
             return False
-        return self.value == other.value
+        return self._value == other._value
 
-    def __lt__(self, other) -> bool:
+    def __lt__(self, other: object) -> bool:
         """Check if this Money is less than another Money object."""
-        if not isinstance(other, Money):
+        other_value = self._get_comparable_value(other)
+        if other_value is None:
             return NotImplemented
-        self._check_same_currency(other)
-        return self.value < other.value
+        return self._value < other_value
 
-    def __le__(self, other) -> bool:
+    def __le__(self, other: object) -> bool:
         """Check if this Money is less than or equal to another Money object."""
-        if not isinstance(other, Money):
+        other_value = self._get_comparable_value(other)
+        if other_value is None:
             return NotImplemented
-        self._check_same_currency(other)
-        return self.value <= other.value
+        return self._value <= other_value
 
-    def __gt__(self, other) -> bool:
+    def __gt__(self, other: object) -> bool:
         """Check if this Money is greater than another Money object."""
-        if not isinstance(other, Money):
+        other_value = self._get_comparable_value(other)
+        if other_value is None:
             return NotImplemented
-        self._check_same_currency(other)
-        return self.value > other.value
+        return self._value > other_value
 
-    def __ge__(self, other) -> bool:
+    def __ge__(self, other: object) -> bool:
         """Check if this Money is greater than or equal to another Money object."""
-        if not isinstance(other, Money):
+        other_value = self._get_comparable_value(other)
+        if other_value is None:
             return NotImplemented
-        self._check_same_currency(other)
-        return self.value >= other.value
+        return self._value >= other_value
 
     # Arithmetic operations
-    def __add__(self, other):
+    def __add__(self, other: object) -> Money:
         """Add two Money objects (same currency) or Money + number."""
+        # Adding int zero leaves Money unchanged; Money is immutable, so return it as is
+        if type(other) is int and other == 0:
+            return self
         if isinstance(other, Money):
             self._check_same_currency(other)
-            return Money(self.value + other.value, self.currency)
-        else:
-            # Add number to Money
-            try:
-                return Money(self.value + Decimal(str(other)), self.currency)
-            except (ValueError, TypeError):
-                return NotImplemented
+            # Check: a sum of valid values can leave the allowed range or, for high-precision
+            # currencies, be rounded by the Decimal context, so validate it like the constructor
+            return Money._new(Money._validate_value(self._value + other._value, self._currency, is_exact_sum=True), self._currency)
+
+        # Add number to Money
+        number = _to_decimal(other)
+        if number is None:
+            return NotImplemented
+        return Money._new(Money._validate_value(self._value + number, self._currency, is_exact_sum=type(other) is int), self._currency)
 
-    def __radd__(self, other):
+    def __radd__(self, other: object) -> Money:
         """Right addition: number + Money."""
+        # `sum` starts with int 0, so return self instead of building a new Money
+        if type(other) is int and other == 0:
+            return self
         return self.__add__(other)
 
-    def __sub__(self, other):
+    def __sub__(self, other: object) -> Money:
         """Subtract two Money objects (same currency) or Money - number."""
         if isinstance(other, Money):
             self._check_same_currency(other)
-            return Money(self.value - other.value, self.currency)
-        else:
-            # Subtract number from Money
-            try:
-                return Money(self.value - Decimal(str(other)), self.currency)
-            except (ValueError, TypeError):
-                return NotImplemented
+            # Check: a difference of valid values can leave the allowed range or, for high-precision
+            # currencies, be rounded by the Decimal context, so validate it like the constructor
+            return Money._new(Money._validate_value(self._value - other._value, self._currency, is_exact_sum=True), self._currency)
 
-    def __rsub__(self, other):
-        """Right subtraction: number - Money."""
-        try:
-            return Money(Decimal(str(other)) - self.value, self.currency)
-        except (ValueError, TypeError):
+        # Subtract number from Money
+        number = _to_decimal(other)
+        if number is None:
             return NotImplemented
+        return Money._new(Money._validate_value(self._value - number, self._currency, is_exact_sum=type(other) is int), self._currency)
 
-    def __mul__(self, other):
-        """Multiply Money by number (returns Money)."""
-        if isinstance(other, Money):
-            return NotImplemented  # Money * Money doesn't make sense
-        try:
-            return Money(self.value * Decimal(str(other)), self.currency)
-        except (ValueError, TypeError):
+    def __rsub__(self, other: object) -> Money:
+        """Right subtraction: number - Money."""
+        number = _to_decimal(other)
+        if number is None:
             return NotImplemented
+        return Money._new(Money._validate_value(number - self._value, self._currency, is_exact_sum=type(other) is int), self._currency)
 
-    def __rmul__(self, other):
+    def __mul__(self, other: object) -> Money:
+        """Multiply Money by number (returns Money)."""
+        number = _to_decimal(other)
+        if number is None:
+            return NotImplemented  # Also covers Money * Money, which doesn't make sense
+        # Zero times any number is zero; self is already quantized, so skip the multiplication
+        if self._value == _ZERO:
+            return self
+        return Money._new(Money._validate_value(self._value * number, self._currency), self._currency)
+
+    def __rmul__(self, other: object) -> Money:
         """Right multiplication: number * Money."""
         return self.__mul__(other)
 
-    def __truediv__(self, other):
+    def __truediv__(self, other: object) -> Money | Decimal:
         """Divide Money by number (returns Money) or Money by Money (returns Decimal)."""
         if isinstance(other, Money):
             self._check_same_currency(other)
-            if other.value == 0:
+            if other._value == _ZERO:
                 raise ZeroDivisionError("Cannot divide by zero Money")
-            return self.value / other.value  # Returns Decimal ratio
-        else:
-            try:
-                divisor = Decimal(str(other))
-                if divisor == 0:
-                    raise ZeroDivisionError("Cannot divide Money by zero")
-                return Money(self.value / divisor, self.currency)
-            except (ValueError, TypeError):
-                return NotImplemented
-
-    def __rtruediv__(self, other):
+            return self._value / other._value  # Returns Decimal ratio
+
+        divisor = _to_decimal(other)
+        if divisor is None:
+            return NotImplemented
+        if divisor == _ZERO:
+            raise ZeroDivisionError("Cannot divide Money by zero")
+        # Zero divided by any number is zero; self is already quantized, so skip the division
+        if self._value == _ZERO:
+            return self
+        return Money._new(Money._validate_value(self._value / divisor, self._currency), self._currency)
+
+    def __rtruediv__(self, other: object) -> Money:
         """Right division: number / Money (not supported)."""
         return NotImplemented
 
-    def __neg__(self):
+    def __neg__(self) -> Money:
         """Return negative Money."""
-        return Money(-self.value, self.currency)
+        return Money._new(-self._value, self._currency)
 
-    def __pos__(self):
+    def __pos__(self) -> Money:
         """Return positive Money (copy)."""
-        return Money(self.value, self.currency)
+        return Money._new(self._value, self._currency)
 
-    def __abs__(self):
+    def __abs__(self) -> Money:
         """Return absolute Money."""
-        return Money(abs(self.value), self.currency)
+        return Money._new(abs(self._value), self._currency)
 
     # String representations
     def __str__(self) -> str:
         """Return string like '1000.50 USD'."""
-        return f"{self.value} {self.currency.code}"
+        return f"{self._value} {self._code}"
 
     def __repr__(self) -> str:
         """Return string like 'Money(1000.50, USD)'."""
-        return f"{self.__class__.__name__}({self.value}, {self.currency.code})"
+        return f"{self.__class__.__name__}({self._value}, {self._code})"
 
     def __hash__(self) -> int:
         """Hash based on value and currency code."""
-        return hash((self.value, self.currency.code))
+        # Money is immutable, so the hash is computed once and cached (-1 means not computed yet)
+        h = self._hash
+        if h == -1:
+            h = hash((self._value, self._code))
+            if h == -1:
+                h = -2
+            self._hash = h
+        return h
 
     @classmethod
     def from_str(cls, value_str: str) -> Money:
@@ -221,14 +419,12 @@ class Money:
         Raises:
             ValueError: If string format is invalid.
         """
-        value_str = value_str.strip()
-        if not value_str:
-            raise ValueError("Value string with $value_str = '' cannot be empty")
-
-        # Split by whitespace
+        # Split by whitespace (also drops leading and trailing whitespace, so no `strip` is needed)
         parts = value_str.split()
         if len(parts) != 2:
-            raise ValueError(f"Value string with $value_str = '{value_str}' must be in format 'value currency_code'")
+            if not parts:
+                raise ValueError("Value string with $value_str = '' cannot be empty")
+            raise ValueError(f"Value string with $value_str = '{value_str.strip()}' must be in format 'value currency_code'")
 
         value_part, currency_part = parts
 
@@ -243,3 +439,137 @@ class Money:
             raise ValueError(f"Invalid currency part '{currency_part}' in string '{value_str}'") from e
 
         return cls(value, currency)
+
+    @classmethod
+    def zero(cls, currency: Currency) -> Money:
+        """Return the shared zero Money for $currency.
+
+        Args:
+            currency (Currency): Currency object.
+
+        Returns:
+            Money: Zero amount in $currency.
+
+        Raises:
+            TypeError: If currency is not Currency instance.
+        """
+        return cls.of(0, currency)
+
+    @classmethod
+    def of(cls, amount: int, currency: Currency) -> Money:
+        """Return Money for a whole $amount, reusing a shared instance for small amounts.
+
+        Amounts from -10 to 10 are created once per currency and then reused. This is
+        safe because Money is immutable. Other amounts create a new Money.
+
+        Args:
+            amount (int): Whole amount (e.g. 0, 1, -1).
+            currency (Currency): Currency object.
+
+        Returns:
+            Money: Money object for $amount in $currency.
+
+        Raises:
+            ValueError: If amount is out of range.
+            TypeError: If amount is not an int or currency is not Currency instance.
+        """
+        # Check: amount must be a whole number, because interned keys assume int amounts
+        if type(amount) is not int:
+            raise TypeError(f"$amount must be an int, but provided value is: {amount!r}")
+
+        # Build non-interned amounts through the regular constructor
+        if not (_INTERN_MIN <= amount <= _INTERN_MAX):
+            return cls(amount, currency)
+
+        key = (amount, id(currency))
+        money = _INTERN.get(key)
+        if money is None:
+            # The interned Money keeps $currency alive, so its id cannot be reused
+            money = cls(amount, currency)
+            _INTERN[key] = money
+        return money
+
+    @classmethod
+    def from_minor_units(cls, minor_units: int, currency: Currency) -> Money:
+        """Create Money from an integer amount in minor units of $currency.
+
+        Minor units are the smallest unit of a currency, e.g. cents for USD (precision 2),
+        so `Money.from_minor_units(12345, USD)` is 123.45 USD.
+
+        Args:
+            minor_units (int): Amount in minor units (Python or NumPy int).
+            currency (Currency): Currency object.
+
+        Returns:
+            Money: Money object.
+
+        Raises:
+            ValueError: If resulting value is out of range.
+            TypeError: If $minor_units is not an integer or currency is not Currency instance.
+        """
+        # Check: minor units must be an exact integer; truncating e.g. 150.7 would lose money silently
+        try:
+            whole_minor_units = operator.index(minor_units)
+        except TypeError:
+            raise TypeError(f"Cannot call `from_minor_units` because $minor_units must be an integer, but provided value is: {minor_units!r}") from None
+
+        return cls(Decimal(whole_minor_units).scaleb(-currency.precision), currency)
+
+    @classmethod
+    def sum_array(cls, minor_units: np.ndarray, currency: Currency) -> Money:
+        """Sum an integer NumPy array of minor-unit amounts into a single Money.
+
+        Use this for bulk arithmetic: convert amounts to minor units once (see
+        `from_minor_units`), let NumPy reduce them in native code, and create Money only
+        for the result. If the total could exceed int64, the amounts are summed exactly
+        with Python ints instead, so the result is never wrong because of overflow.
+
+        Args:
+            minor_units (np.ndarray): Integer array of amounts in minor units.
+            currency (Currency): Currency of all amounts.
+
+        Returns:
+            Money: Sum of all amounts.
+
+        Raises:
+            TypeError: If $minor_units has no integer dtype.
+            ValueError: If the sum is out of range.
+        """
+        # Check: array must hold integers, because floats would lose minor-unit exactness
+        if minor_units.dtype.kind not in "iu":
+            raise TypeError(f"Cannot call `sum_array` because $minor_units must have an integer dtype, but provided dtype is: {minor_units.dtype}")
+
+        # Sum exactly with Python ints when the int64 sum could wrap around
+        if _may_overflow_int64(minor_units):
+            return cls.from_minor_units(sum(minor_units.tolist()), currency)
+        return cls.from_minor_units(int(minor_units.sum()), currency)
+
+    @classmethod
+    def cumsum_array(cls, minor_units: np.ndarray, currency: Currency) -> list[Money]:
+        """Compute running totals of an integer NumPy array of minor-unit amounts.
+
+        The cumulative sum is computed by NumPy in native code; Money objects are created
+        only for the results. As in `sum_array`, totals that could exceed int64 are computed
+        exactly with Python ints instead.
+
+        Args:
+            minor_units (np.ndarray): Integer array of amounts in minor units.
+            currency (Currency): Currency of all amounts.
+
+        Returns:
+            list[Money]: Running total after each amount.
+
+        Raises:
+            TypeError: If $minor_units has no integer dtype.
+            ValueError: If a running total is out of range.
+        """
+        # Check: array must hold integers, because floats would lose minor-unit exactness
+        if minor_units.dtype.kind not in "iu":
+            raise TypeError(f"Cannot call `cumsum_array` because $minor_units must have an integer dtype, but provided dtype is: {minor_units.dtype}")
+
+        # Accumulate exactly with Python ints when the int64 cumulative sum could wrap around
+        if _may_overflow_int64(minor_units):
+            totals = list(itertools.accumulate(minor_units.tolist()))
+        else:
+            totals = minor_units.cumsum().tolist()
+        return [cls.from_minor_units(total, currency) for total in totals]
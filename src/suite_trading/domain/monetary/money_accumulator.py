@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import operator
+
+from suite_trading.domain.monetary.currency import Currency
+from suite_trading.domain.monetary.money import Money
+
+
+class MoneyAccumulator:
+    """Accumulate Money amounts of one currency as an integer number of minor units.
+
+    Purpose:
+        Fast running totals for hot loops (e.g. P&L update on every tick). Each add is a
+        plain int addition instead of a Decimal addition plus a new Money object. Money is
+        created only when `get_total` is called.
+
+    Notes:
+        - Minor units are the smallest unit of a currency, e.g. cents for USD.
+        - All added amounts must be in the accumulator's currency.
+    """
+
+    __slots__ = ("_currency", "_minor_units")
+
+    # region Init
+
+    def __init__(self, currency: Currency) -> None:
+        """Initialize an empty accumulator.
+
+        Args:
+            currency (Currency): Currency of all accumulated amounts.
+
+        Raises:
+            TypeError: If $currency is not Currency instance.
+        """
+        # Check: currency must be an instance of Currency
+        if not isinstance(currency, Currency):
+            raise TypeError(f"$currency must be a Currency instance, but provided value is: {currency}")
+
+        self._currency = currency
+        self._minor_units = 0
+
+    # endregion
+
+    # region Main
+
+    def add_minor_units(self, minor_units: int) -> None:
+        """Add an amount given in minor units (e.g. 150 for 1.50 USD).
+
+        Args:
+            minor_units (int): Amount in minor units (Python or NumPy int).
+
+        Raises:
+            TypeError: If $minor_units is not an integer.
+        """
+        # Check: minor units must be an exact integer; a float would turn the total into a float and lose amounts
+        try:
+            self._minor_units += operator.index(minor_units)
+        except TypeError:
+            raise TypeError(f"Cannot call `{self.__class__.__name__}.add_minor_units` because $minor_units must be an integer, but provided value is: {minor_units!r}") from None
+
+    def add_money(self, money: Money) -> None:
+        """Add a Money amount.
+
+        Args:
+            money (Money): Amount in the accumulator's currency.
+
+        Raises:
+            ValueError: If $money currency differs from the accumulator's currency.
+        """
+        # Check: amount must be in the accumulator's currency (identity check first for speed)
+        currency = money.currency
+        if currency is not self._currency and currency != self._currency:
+            raise ValueError(f"Cannot call `{self.__class__.__name__}.add_money` because $money.currency ('{currency}') differs from accumulator currency ('{self._currency}')")
+
+        self._minor_units += money.to_minor_units()
+
+    def get_total(self) -> Money:
+        """Return the accumulated total as Money.
+
+        Returns:
+            Money: Sum of all added amounts.
+
+        Raises:
+            ValueError: If the total is out of Money's allowed range.
+        """
+        return Money.from_minor_units(self._minor_units, self._currency)
+
+    def reset(self) -> None:
+        """Clear the accumulated total."""
+        self._minor_units = 0
+
+    # endregion
+
+    # region Magic methods
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(total={self.get_total()})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(currency={self._currency.code}, minor_units={self._minor_units})"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def currency(self) -> Currency:
+        """Get the currency."""
+        return self._currency
+
+    @property
+    def minor_units(self) -> int:
+        """Get the accumulated total in minor units."""
+        return self._minor_units
+
+    # endregion
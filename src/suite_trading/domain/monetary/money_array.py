@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from suite_trading.domain.monetary.currency import Currency
+from suite_trading.domain.monetary.money import Money
+
+# Range of amounts in minor units that MoneyArray can store
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+class MoneyArray:
+    """Array of amounts in one currency, stored as a contiguous int64 NumPy array of minor units.
+
+    Purpose:
+        Vectorized arithmetic over many amounts (e.g. P&L series, position history). A list of
+        Money holds one object plus one Decimal per amount; MoneyArray holds one buffer and
+        lets NumPy add, subtract, and sum in native code.
+
+    Notes:
+        - Minor units are the smallest unit of a currency, e.g. cents for USD.
+        - Convert with `from_money_list` and `to_money_list` at the boundaries only.
+        - Element-wise + and - use int64 arithmetic, which wraps around silently, so results
+          must fit into int64. `sum` is exact.
+    """
+
+    __slots__ = ("_minor_units", "_currency")
+
+    # region Init
+
+    def __init__(self, minor_units: np.ndarray, currency: Currency) -> None:
+        """Initialize from an int64 array of minor units.
+
+        The array is copied and the copy is made read-only, so later changes to $minor_units
+        do not affect this MoneyArray (it is immutable like Money).
+
+        Args:
+            minor_units (np.ndarray): int64 array of amounts in minor units.
+            currency (Currency): Currency of all amounts.
+
+        Raises:
+            TypeError: If $minor_units is not an int64 array or $currency is not Currency instance.
+        """
+        # Check: amounts must be int64 so that arithmetic stays exact and vectorized
+        if not isinstance(minor_units, np.ndarray) or minor_units.dtype != np.int64:
+            raise TypeError(f"$minor_units must be a NumPy array with dtype int64, but provided value is: {minor_units!r}")
+
+        # Check: currency must be an instance of Currency
+        if not isinstance(currency, Currency):
+            raise TypeError(f"$currency must be a Currency instance, but provided value is: {currency}")
+
+        # Keep a private read-only copy so the caller cannot change the amounts afterwards
+        owned_minor_units = minor_units.copy()
+        owned_minor_units.flags.writeable = False
+        self._minor_units = owned_minor_units
+        self._currency = currency
+
+    @classmethod
+    def _new(cls, minor_units: np.ndarray, currency: Currency) -> MoneyArray:
+        """Create MoneyArray from a freshly built int64 array, skipping checks and the copy.
+
+        Internal fast-path for results of MoneyArray operations. Callers are responsible for
+        $minor_units being a new int64 array that nobody else references.
+
+        Args:
+            minor_units (np.ndarray): New int64 array of amounts in minor units.
+            currency (Currency): Currency of all amounts.
+
+        Returns:
+            MoneyArray: New MoneyArray object.
+        """
+        minor_units.flags.writeable = False
+        money_array = object.__new__(cls)
+        money_array._minor_units = minor_units
+        money_array._currency = currency
+        return money_array
+
+    @classmethod
+    def from_money_list(cls, money_list: Sequence[Money]) -> MoneyArray:
+        """Create MoneyArray from Money objects of one currency.
+
+        Args:
+            money_list (Sequence[Money]): Non-empty sequence of Money in the same currency.
+
+        Returns:
+            MoneyArray: Array with the same amounts.
+
+        Raises:
+            ValueError: If $money_list is empty, contains different currencies, or an amount
+                in minor units does not fit into int64.
+        """
+        # Check: currency is taken from the first element, so the list must not be empty
+        if not money_list:
+            raise ValueError("Cannot call `from_money_list` because $money_list is empty")
+
+        currency = money_list[0].currency
+        for money in money_list:
+            if money.currency != currency:
+                raise ValueError(f"Cannot call `from_money_list` because $money_list contains different currencies: {currency} and {money.currency}")
+
+        # Check: every amount in minor units must fit into int64 (e.g. large BTC amounts at precision 8 may not)
+        minor_units_list = [money.to_minor_units() for money in money_list]
+        for money, minor_units in zip(money_list, minor_units_list):
+            if not (_INT64_MIN <= minor_units <= _INT64_MAX):
+                raise ValueError(f"Cannot call `from_money_list` because $money ({money}) is {minor_units} minor units, which does not fit into int64 range [{_INT64_MIN}, {_INT64_MAX}]")
+
+        return cls._new(np.array(minor_units_list, dtype=np.int64), currency)
+
+    # endregion
+
+    # region Main
+
+    def sum(self) -> Money:
+        """Return the sum of all amounts.
+
+        Returns:
+            Money: Total amount.
+        """
+        return Money.sum_array(self._minor_units, self._currency)
+
+    def to_money_list(self) -> list[Money]:
+        """Convert to a list of Money objects.
+
+        Returns:
+            list[Money]: One Money per amount.
+        """
+        return [Money.from_minor_units(minor_units, self._currency) for minor_units in self._minor_units.tolist()]
+
+    # endregion
+
+    # region Internal
+
+    def _check_same_currency(self, other: MoneyArray) -> None:
+        """Check if two MoneyArray objects have the same currency.
+
+        Args:
+            other (MoneyArray): The other MoneyArray object.
+
+        Raises:
+            ValueError: If currencies don't match.
+        """
+        if self._currency is not other._currency and self._currency != other._currency:
+            raise ValueError(f"Cannot operate on different currencies: {self._currency} and {other._currency}")
+
+    # endregion
+
+    # region Magic methods
+
+    def __add__(self, other: object) -> MoneyArray:
+        """Add two MoneyArray objects (same currency) element-wise."""
+        if not isinstance(other, MoneyArray):
+            return NotImplemented
+        self._check_same_currency(other)
+        return MoneyArray._new(self._minor_units + other._minor_units, self._currency)
+
+    def __sub__(self, other: object) -> MoneyArray:
+        """Subtract two MoneyArray objects (same currency) element-wise."""
+        if not isinstance(other, MoneyArray):
+            return NotImplemented
+        self._check_same_currency(other)
+        return MoneyArray._new(self._minor_units - other._minor_units, self._currency)
+
+    def __len__(self) -> int:
+        return len(self._minor_units)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(currency={self._currency.code}, size={len(self)})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._minor_units!r}, {self._currency.code})"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def minor_units(self) -> np.ndarray:
+        """Get the read-only int64 array of amounts in minor units."""
+        return self._minor_units
+
+    @property
+    def currency(self) -> Currency:
+        """Get the currency."""
+        return self._currency
+
+    # endregion